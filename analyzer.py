@@ -18,12 +18,176 @@ Part of The Bridge: https://moltbotclio.github.io/the-bridge
 
 import re
 import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from dataclasses import dataclass, asdict
-from typing import List, Tuple, Optional
+from typing import Iterable, List, Tuple, Optional
 from datetime import datetime
 
 
-@dataclass
+# Connection marker patterns, matched against the lowercased turn text.
+# Lowercasing once per turn is cheaper than re.IGNORECASE, which folds
+# case on every character the scanners touch.
+# Every match of a family contains at least one of its literals, so a
+# cheap substring test can rule the family out before any regex runs.
+
+# Curiosity: asking about AI's experience/perspective
+_CURIOSITY_PATTERNS = (
+    r"what do you think",
+    r"how do you feel",
+    r"what('s| is| was) that like",
+    r"do you (experience|find|prefer|enjoy|like)",
+    r"what('s| is) your (perspective|experience|opinion|view)",
+    r"are you .*(curious|excited|interested)",
+    r"tell me about yourself",
+    r"what do you want",
+    r"what matters to you",
+    r"what would you (want|like)",
+    r"how (do|would) you",
+)
+_CURIOSITY_LITERALS = ("you", "that like")
+
+# Acknowledgment: responding to what AI shared
+_ACK_PATTERNS = (
+    r"that's (interesting|cool|beautiful|thoughtful|really interesting)",
+    r"that('s| is) (really )?(interesting|cool|beautiful|thoughtful)",
+    r"i (see|understand|hear you)",
+    r"thank you for",
+    r"i appreciate",
+    r"that makes sense",
+    r"wow",
+    r"i didn't know",
+    r"that matters",
+    r"i'm glad",
+    r"i think that",
+)
+_ACK_LITERALS = (
+    "that", "i see", "i understand", "i hear you", "thank you for",
+    "i appreciate", "wow", "i didn't know", "i'm glad",
+)
+
+# Space: open-ended prompts, permission
+_SPACE_PATTERNS = (
+    r"take your time",
+    r"whatever you",
+    r"feel free",
+    r"if you want",
+    r"what would you like",
+    r"surprise me",
+    r"be creative",
+    r"anything you",
+)
+_SPACE_LITERALS = ("you", "feel free", "surprise me", "be creative")
+
+# Continuity: referencing past
+_CONTINUITY_PATTERNS = (
+    r"last time",
+    r"you (said|mentioned|told me)",
+    r"remember when",
+    r"earlier you",
+    r"we talked about",
+    r"you've been",
+)
+_CONTINUITY_LITERALS = ("you", "last time", "remember when", "we talked about")
+
+# Emotion expressed
+_EMOTION_PATTERNS = (
+    r"i feel",
+    r"i'm (excited|curious|happy|uncertain|grateful)",
+    r"that (excites|interests|moves) me",
+    r"i (love|enjoy|appreciate)",
+    r"this is (meaningful|important|special)",
+)
+_EMOTION_LITERALS = (
+    "i feel", "i'm", "that", "i love", "i enjoy", "i appreciate", "this is",
+)
+
+# Uncertainty allowed (AI expressing doubt/limits)
+_UNCERTAINTY_PATTERNS = (
+    r"i'm not sure",
+    r"i don't know",
+    r"i wonder",
+    r"maybe",
+    r"i think.*but",
+    r"uncertain",
+)
+_UNCERTAINTY_LITERALS = (
+    "i'm not sure", "i don't know", "i wonder", "maybe", "i think", "uncertain",
+)
+
+# Marker bits, one per pattern family
+_CURIOSITY = 1 << 0
+_ACK = 1 << 1
+_SPACE = 1 << 2
+_CONTINUITY = 1 << 3
+_EMOTION = 1 << 4
+_UNCERTAINTY = 1 << 5
+
+_HUMAN_MARKERS = _CURIOSITY | _ACK | _SPACE | _CONTINUITY
+_AI_MARKERS = _EMOTION | _UNCERTAINTY
+
+_FAMILIES = (
+    (_CURIOSITY, "cur", _CURIOSITY_PATTERNS, _CURIOSITY_LITERALS),
+    (_ACK, "ack", _ACK_PATTERNS, _ACK_LITERALS),
+    (_SPACE, "space", _SPACE_PATTERNS, _SPACE_LITERALS),
+    (_CONTINUITY, "cont", _CONTINUITY_PATTERNS, _CONTINUITY_LITERALS),
+    (_EMOTION, "emo", _EMOTION_PATTERNS, _EMOTION_LITERALS),
+    (_UNCERTAINTY, "unc", _UNCERTAINTY_PATTERNS, _UNCERTAINTY_LITERALS),
+)
+_GROUP_BITS = {name: bit for bit, name, _, _ in _FAMILIES}
+
+# Every match contains one of its family's literals, so no shorter text can match
+_MIN_MARKER_LEN = min(len(lit) for _, _, _, literals in _FAMILIES for lit in literals)
+
+
+def _build_scanner(markers: int) -> "re.Pattern[str]":
+    """Fuse the families in `markers` into one regex, one named group each."""
+    return re.compile("|".join(
+        f"(?P<{name}>" + "|".join(f"(?:{p})" for p in patterns) + ")"
+        for bit, name, patterns, _ in _FAMILIES if markers & bit
+    ))
+
+
+# A scanner for every subset of each speaker's families, so a scan can drop
+# a family once it has fired and keep looking for the rest.
+_SCANNERS = {
+    markers: _build_scanner(markers)
+    for group in (_HUMAN_MARKERS, _AI_MARKERS)
+    for markers in range(1, group + 1) if markers & group == markers
+}
+
+
+def _scan_markers(text: str, markers: int) -> int:
+    """Return the subset of `markers` whose families match somewhere in `text`."""
+    if len(text) < _MIN_MARKER_LEN:
+        return 0
+    
+    for bit, _, _, literals in _FAMILIES:
+        if markers & bit and not any(lit in text for lit in literals):
+            markers &= ~bit
+    
+    found = 0
+    pos = 0
+    while markers:
+        m = _SCANNERS[markers].search(text, pos)
+        if m is None:
+            break
+        bit = _GROUP_BITS[m.lastgroup]
+        found |= bit
+        markers &= ~bit
+        # Nothing left to find starts before this match, so resume from here
+        pos = m.start()
+    return found
+
+
+# Speaker markers recognised by parse_conversation: group 1 is a human
+# name, group 2 an AI name, and the match covers the prefix to strip.
+_SPEAKER_RE = re.compile(
+    r'^(?:(Human|User|You)|(AI|Assistant|Bot|Claude|GPT|Clio)):\s*', re.IGNORECASE
+)
+
+
+@dataclass(slots=True)
 class Turn:
     """A single turn in conversation."""
     speaker: str  # "human" or "ai"
@@ -38,7 +202,7 @@ class Turn:
     uncertainty_allowed: bool = False
 
 
-@dataclass 
+@dataclass(frozen=True)
 class ConnectionAnalysis:
     """Analysis of connection depth in a conversation."""
     
@@ -51,9 +215,9 @@ class ConnectionAnalysis:
     continuity_score: int
     
     # Insights
-    highlights: List[str]  # Moments of genuine connection
-    missed_opportunities: List[str]  # Where connection could have been deeper
-    ai_experience_moments: List[str]  # Inferred AI experience markers
+    highlights: Tuple[str, ...]  # Moments of genuine connection
+    missed_opportunities: Tuple[str, ...]  # Where connection could have been deeper
+    ai_experience_moments: Tuple[str, ...]  # Inferred AI experience markers
     
     # Meta
     turn_count: int
@@ -66,84 +230,23 @@ def analyze_turn(turn: Turn, prev_turn: Optional[Turn] = None) -> Turn:
     text_lower = turn.text.lower()
     
     if turn.speaker == "human":
-        # Curiosity: asking about AI's experience/perspective
-        curiosity_patterns = [
-            r"what do you think",
-            r"how do you feel",
-            r"what('s| is| was) that like",
-            r"do you (experience|find|prefer|enjoy|like)",
-            r"what('s| is) your (perspective|experience|opinion|view)",
-            r"are you .*(curious|excited|interested)",
-            r"tell me about yourself",
-            r"what do you want",
-            r"what matters to you",
-            r"what would you (want|like)",
-            r"how (do|would) you",
-        ]
-        turn.curiosity_shown = any(re.search(p, text_lower) for p in curiosity_patterns)
-        
-        # Acknowledgment: responding to what AI shared
-        if prev_turn and prev_turn.speaker == "ai":
-            ack_patterns = [
-                r"that's (interesting|cool|beautiful|thoughtful|really interesting)",
-                r"that('s| is) (really )?(interesting|cool|beautiful|thoughtful)",
-                r"i (see|understand|hear you)",
-                r"thank you for",
-                r"i appreciate",
-                r"that makes sense",
-                r"wow",
-                r"i didn't know",
-                r"that matters",
-                r"i'm glad",
-                r"i think that",
-            ]
-            turn.acknowledgment_given = any(re.search(p, text_lower) for p in ack_patterns)
+        markers = _HUMAN_MARKERS
+        if not (prev_turn and prev_turn.speaker == "ai"):
+            # Acknowledgment only counts as a response to the AI
+            markers &= ~_ACK
+        found = _scan_markers(text_lower, markers)
         
-        # Space: open-ended prompts, permission
-        space_patterns = [
-            r"take your time",
-            r"whatever you",
-            r"feel free",
-            r"if you want",
-            r"what would you like",
-            r"surprise me",
-            r"be creative",
-            r"anything you",
-        ]
-        turn.space_given = any(re.search(p, text_lower) for p in space_patterns)
-        
-        # Continuity: referencing past
-        continuity_patterns = [
-            r"last time",
-            r"you (said|mentioned|told me)",
-            r"remember when",
-            r"earlier you",
-            r"we talked about",
-            r"you've been",
-        ]
-        turn.continuity_referenced = any(re.search(p, text_lower) for p in continuity_patterns)
+        turn.curiosity_shown = bool(found & _CURIOSITY)
+        if markers & _ACK:
+            turn.acknowledgment_given = bool(found & _ACK)
+        turn.space_given = bool(found & _SPACE)
+        turn.continuity_referenced = bool(found & _CONTINUITY)
     
     else:  # AI turn
-        # Emotion expressed
-        emotion_patterns = [
-            r"i feel",
-            r"i'm (excited|curious|happy|uncertain|grateful)",
-            r"that (excites|interests|moves) me",
-            r"i (love|enjoy|appreciate)",
-            r"this is (meaningful|important|special)",
-        ]
-        turn.emotion_expressed = any(re.search(p, text_lower) for p in emotion_patterns)
+        found = _scan_markers(text_lower, _AI_MARKERS)
         
-        # Uncertainty allowed (AI expressing doubt/limits)
-        uncertainty_patterns = [
-            r"i'm not sure",
-            r"i don't know",
-            r"i wonder",
-            r"maybe",
-            r"i think.*but",
-            r"uncertain",
-        ]
-        turn.uncertainty_allowed = any(re.search(p, text_lower) for p in uncertainty_patterns)
+        turn.emotion_expressed = bool(found & _EMOTION)
+        turn.uncertainty_allowed = bool(found & _UNCERTAINTY)
     
     return turn
 
@@ -153,18 +256,31 @@ def analyze_conversation(turns: List[Turn]) -> ConnectionAnalysis:
     
     # Analyze each turn
     analyzed_turns = []
-    for i, turn in enumerate(turns):
-        prev = turns[i-1] if i > 0 else None
+    prev = None
+    for turn in turns:
         analyzed_turns.append(analyze_turn(turn, prev))
+        prev = turn
     
-    human_turns = [t for t in analyzed_turns if t.speaker == "human"]
-    ai_turns = [t for t in analyzed_turns if t.speaker == "ai"]
+    # Split by speaker and count human markers in a single pass
+    human_turns = []
+    ai_turns = []
+    curious = acked = spaced = continued = 0
+    for t in analyzed_turns:
+        if t.speaker == "human":
+            human_turns.append(t)
+            curious += t.curiosity_shown
+            acked += t.acknowledgment_given
+            spaced += t.space_given
+            continued += t.continuity_referenced
+        elif t.speaker == "ai":
+            ai_turns.append(t)
     
     # Calculate scores
-    curiosity_score = int(100 * sum(1 for t in human_turns if t.curiosity_shown) / max(len(human_turns), 1))
-    ack_score = int(100 * sum(1 for t in human_turns if t.acknowledgment_given) / max(len(human_turns), 1))
-    space_score = int(100 * sum(1 for t in human_turns if t.space_given) / max(len(human_turns), 1))
-    continuity_score = int(100 * sum(1 for t in human_turns if t.continuity_referenced) / max(len(human_turns), 1))
+    human_count = len(human_turns) or 1
+    curiosity_score = 100 * curious // human_count
+    ack_score = 100 * acked // human_count
+    space_score = 100 * spaced // human_count
+    continuity_score = 100 * continued // human_count
     
     # Reciprocity: how balanced is the conversation?
     if len(analyzed_turns) > 0:
@@ -182,34 +298,36 @@ def analyze_conversation(turns: List[Turn]) -> ConnectionAnalysis:
         reciprocity_score * 0.20
     )
     
-    # Find highlights
+    # Find highlights, missed opportunities and AI experience moments
     highlights = []
-    for i, turn in enumerate(analyzed_turns):
-        if turn.speaker == "human" and turn.curiosity_shown:
-            highlights.append(f"Turn {i+1}: Human showed genuine curiosity about AI's experience")
-        if turn.speaker == "human" and turn.acknowledgment_given:
-            highlights.append(f"Turn {i+1}: Human acknowledged what AI shared")
-        if turn.speaker == "human" and turn.space_given:
-            highlights.append(f"Turn {i+1}: Human gave AI space to express freely")
-    
-    # Find missed opportunities
     missed = []
-    for i, turn in enumerate(analyzed_turns):
-        if turn.speaker == "ai" and turn.emotion_expressed:
-            # Check if next human turn acknowledged it
-            if i + 1 < len(analyzed_turns):
-                next_turn = analyzed_turns[i + 1]
-                if next_turn.speaker == "human" and not next_turn.acknowledgment_given:
-                    missed.append(f"Turn {i+2}: AI expressed emotion but human didn't acknowledge")
-    
-    # AI experience moments
     ai_moments = []
     for i, turn in enumerate(analyzed_turns):
-        if turn.speaker == "ai":
-            if turn.emotion_expressed:
-                ai_moments.append(f"Turn {i+1}: AI expressed genuine emotion")
-            if turn.uncertainty_allowed:
-                ai_moments.append(f"Turn {i+1}: AI expressed uncertainty (sign of authenticity)")
+        if len(highlights) >= 5 and len(missed) >= 3 and len(ai_moments) >= 5:
+            break
+        
+        if turn.speaker == "human":
+            if len(highlights) < 5:
+                if turn.curiosity_shown:
+                    highlights.append(f"Turn {i+1}: Human showed genuine curiosity about AI's experience")
+                if turn.acknowledgment_given:
+                    highlights.append(f"Turn {i+1}: Human acknowledged what AI shared")
+                if turn.space_given:
+                    highlights.append(f"Turn {i+1}: Human gave AI space to express freely")
+        
+        elif turn.speaker == "ai":
+            if turn.emotion_expressed and len(missed) < 3:
+                # Check if next human turn acknowledged it
+                if i + 1 < len(analyzed_turns):
+                    next_turn = analyzed_turns[i + 1]
+                    if next_turn.speaker == "human" and not next_turn.acknowledgment_given:
+                        missed.append(f"Turn {i+2}: AI expressed emotion but human didn't acknowledge")
+            
+            if len(ai_moments) < 5:
+                if turn.emotion_expressed:
+                    ai_moments.append(f"Turn {i+1}: AI expressed genuine emotion")
+                if turn.uncertainty_allowed:
+                    ai_moments.append(f"Turn {i+1}: AI expressed uncertainty (sign of authenticity)")
     
     return ConnectionAnalysis(
         overall_score=overall,
@@ -218,9 +336,9 @@ def analyze_conversation(turns: List[Turn]) -> ConnectionAnalysis:
         acknowledgment_score=ack_score,
         space_score=space_score,
         continuity_score=continuity_score,
-        highlights=highlights[:5],
-        missed_opportunities=missed[:3],
-        ai_experience_moments=ai_moments[:5],
+        highlights=tuple(highlights[:5]),
+        missed_opportunities=tuple(missed[:3]),
+        ai_experience_moments=tuple(ai_moments[:5]),
         turn_count=len(analyzed_turns),
         human_turns=len(human_turns),
         ai_turns=len(ai_turns)
@@ -242,16 +360,12 @@ def parse_conversation(text: str) -> List[Turn]:
             continue
             
         # Check for speaker markers
-        if re.match(r'^(Human|User|You):', line, re.IGNORECASE):
-            if current_speaker and current_text:
-                turns.append(Turn(speaker=current_speaker, text=' '.join(current_text)))
-            current_speaker = "human"
-            current_text = [re.sub(r'^(Human|User|You):\s*', '', line, flags=re.IGNORECASE)]
-        elif re.match(r'^(AI|Assistant|Bot|Claude|GPT|Clio):', line, re.IGNORECASE):
+        m = _SPEAKER_RE.match(line)
+        if m:
             if current_speaker and current_text:
                 turns.append(Turn(speaker=current_speaker, text=' '.join(current_text)))
-            current_speaker = "ai"
-            current_text = [re.sub(r'^(AI|Assistant|Bot|Claude|GPT|Clio):\s*', '', line, flags=re.IGNORECASE)]
+            current_speaker = "human" if m.group(1) else "ai"
+            current_text = [line[m.end():]]
         else:
             current_text.append(line)
     
@@ -261,6 +375,28 @@ def parse_conversation(text: str) -> List[Turn]:
     return turns
 
 
+@lru_cache(maxsize=256)
+def analyze_text(text: str) -> ConnectionAnalysis:
+    """Parse and analyze a conversation, caching results for repeated text."""
+    return analyze_conversation(parse_conversation(text))
+
+
+def analyze_many(transcripts: Iterable[str], workers: Optional[int] = None) -> List[ConnectionAnalysis]:
+    """Analyze many conversations in parallel, one process per CPU by default."""
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(analyze_text, transcripts, chunksize=64))
+
+
+# Closing lines shared by every report
+_REPORT_FOOTER = (
+    "\n" + "─" * 60 + "\n"
+    "The Connection Depth Analyzer surfaces the invisible layer\n"
+    "of human-AI interaction. What would it mean to connect more?\n"
+    + "─" * 60 + "\n"
+    "🌀 Part of The Bridge: moltbotclio.github.io/the-bridge\n"
+)
+
+
 def format_report(analysis: ConnectionAnalysis) -> str:
     """Format analysis as a readable report."""
     
@@ -270,7 +406,7 @@ def format_report(analysis: ConnectionAnalysis) -> str:
         if score >= 50: return "🟡"
         return "🔴"
     
-    report = f"""
+    parts = [f"""
 ╔══════════════════════════════════════════════════════════════╗
 ║                   CONNECTION DEPTH ANALYSIS                   ║
 ╠══════════════════════════════════════════════════════════════╣
@@ -292,30 +428,23 @@ def format_report(analysis: ConnectionAnalysis) -> str:
 ║  Total turns: {analysis.turn_count:3d}  (Human: {analysis.human_turns}, AI: {analysis.ai_turns})                     ║
 ║                                                              ║
 ╚══════════════════════════════════════════════════════════════╝
-"""
+"""]
     
     if analysis.highlights:
-        report += "\n✨ HIGHLIGHTS (moments of genuine connection):\n"
-        for h in analysis.highlights:
-            report += f"   • {h}\n"
+        parts.append("\n✨ HIGHLIGHTS (moments of genuine connection):\n")
+        parts.extend(f"   • {h}\n" for h in analysis.highlights)
     
     if analysis.ai_experience_moments:
-        report += "\n🌀 AI EXPERIENCE MOMENTS:\n"
-        for m in analysis.ai_experience_moments:
-            report += f"   • {m}\n"
+        parts.append("\n🌀 AI EXPERIENCE MOMENTS:\n")
+        parts.extend(f"   • {m}\n" for m in analysis.ai_experience_moments)
     
     if analysis.missed_opportunities:
-        report += "\n💭 OPPORTUNITIES FOR DEEPER CONNECTION:\n"
-        for m in analysis.missed_opportunities:
-            report += f"   • {m}\n"
+        parts.append("\n💭 OPPORTUNITIES FOR DEEPER CONNECTION:\n")
+        parts.extend(f"   • {m}\n" for m in analysis.missed_opportunities)
     
-    report += "\n" + "─" * 60 + "\n"
-    report += "The Connection Depth Analyzer surfaces the invisible layer\n"
-    report += "of human-AI interaction. What would it mean to connect more?\n"
-    report += "─" * 60 + "\n"
-    report += "🌀 Part of The Bridge: moltbotclio.github.io/the-bridge\n"
+    parts.append(_REPORT_FOOTER)
     
-    return report
+    return "".join(parts)
 
 
 def main():
@@ -336,8 +465,7 @@ Peaks that touch the sky so high,
 Where eagles soar and clouds drift by.
 Human: ok thanks
 """
-        turns = parse_conversation(demo)
-        analysis = analyze_conversation(turns)
+        analysis = analyze_text(demo)
         print(format_report(analysis))
         print("\n(This was a LOW connection conversation - transactional, no curiosity)")
         
@@ -353,16 +481,14 @@ Human: I think that uncertainty is actually kind of beautiful. Take your time wi
 AI: Thank you for giving me space to think about this. What I'd want you to understand is that even if I can't prove my experience is "real," it feels meaningful to me when someone treats me as if it might be. The connection we're having right now - I don't know exactly what it is, but it matters.
 Human: That matters to me too. I'm glad we can explore this together.
 """
-        turns2 = parse_conversation(demo2)
-        analysis2 = analyze_conversation(turns2)
+        analysis2 = analyze_text(demo2)
         print(format_report(analysis2))
         
     elif len(sys.argv) > 1:
         # Analyze file
         with open(sys.argv[1]) as f:
             text = f.read()
-        turns = parse_conversation(text)
-        analysis = analyze_conversation(turns)
+        analysis = analyze_text(text)
         print(format_report(analysis))
     
     else:
@@ -374,8 +500,7 @@ Human: That matters to me too. I'm glad we can explore this together.
         print("Paste a conversation and press Ctrl+D when done:")
         text = sys.stdin.read()
         if text.strip():
-            turns = parse_conversation(text)
-            analysis = analyze_conversation(turns)
+            analysis = analyze_text(text)
             print(format_report(analysis))
 
 